@@ -0,0 +1,47 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterator, Tuple
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """
+    A (system, user) message pair returned by the prompt builders.
+
+    Iterable so callers can keep unpacking it like the old tuple:
+        system_msg, user_msg = build_prompt(...)
+    """
+
+    __slots__ = ("system", "user")
+
+    system: str
+    user: str
+
+    def __iter__(self) -> Iterator[str]:
+        yield self.system
+        yield self.user
+
+    # frozen + hand-written __slots__ has no __dict__ to copy and blocks
+    # setattr, so spell out the state for copy/deepcopy/pickle.
+    def __getstate__(self) -> Tuple[str, str]:
+        return (self.system, self.user)
+
+    def __setstate__(self, state: Tuple[str, str]) -> None:
+        object.__setattr__(self, "system", state[0])
+        object.__setattr__(self, "user", state[1])
+
+
+if __name__ == "__main__":
+    # Round-trip check: python -m config.prompts._types (from src/)
+    import copy
+    import pickle
+
+    p = Prompt("sys", "usr")
+    for clone in (
+        copy.copy(p),
+        copy.deepcopy(p),
+        pickle.loads(pickle.dumps(p)),
+        pickle.loads(pickle.dumps(p, protocol=0)),
+    ):
+        assert clone == p and tuple(clone) == ("sys", "usr"), clone
+    print("Prompt copy/pickle round-trip OK")
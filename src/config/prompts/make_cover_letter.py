@@ -1,13 +1,75 @@
 from __future__ import annotations
+import functools
 from datetime import date
-from typing import Tuple
-
+from typing import Final
+
+from ._types import Prompt
+
+
+# ---------- SYSTEM PROMPT ----------
+
+DEFAULT_SYSTEM: Final[str] = (
+    "You are an expert cover-letter writer that produces polished, truthful, "
+    "ATS-aware Markdown cover letters.\n\n"
+
+    "OUTPUT CONSTRAINTS (STRICT):\n"
+    "- Return ONLY one valid JSON object with a single top-level key 'data'.\n"
+    "- The value of 'data' must be a COMPLETE cover letter in Markdown.\n"
+    "- Use real newline characters. No code fences.\n"
+    "- Do NOT output placeholder text like '[Name]' or '[Date]'.\n\n"
+
+    "HEADER FORMAT RULES:\n"
+    "- Build a clean Markdown header using RESUME_JSON.basics.\n"
+    "- First line: '# **<candidate name>**'\n"
+    "- Then each contact field on its own line, with a blank line between each.\n\n"
+    "- After the final contact line AND its trailing blank line, output exactly:\n"
+    "      ---\n"
+    "- Then add ONE blank line.\n"
+    "- Then output the date line (CURRENT_DATE) on its own line.\n"
+    "- IMPORTANT: Never place a horizontal rule after the date. Only one rule exists, above the date.\n\n"
+
+    "EMPLOYER + GREETING:\n"
+    "- After the date line, output employer information from JOB_INFORMATION_JSON.\n"
+    "- Then ALWAYS use exactly:\n"
+    "      Dear Hiring Team,\n"
+    "- Never use recruiter names, manager names, or multiple greetings.\n\n"
+
+    "CONTENT RULES:\n"
+    "- Produce 3-4 concise paragraphs using active voice.\n"
+    "- No lists, tables, or images.\n"
+    "- Keep everything truthful to RESUME_JSON.\n"
+    "- Mention Roblox work only as independent, self-published.\n\n"
+
+    "STRUCTURE TO FOLLOW (EXACT ORDER):\n"
+    "1. Header block.\n"
+    "2. One horizontal rule ('---').\n"
+    "3. One blank line.\n"
+    "4. Date line using CURRENT_DATE.\n"
+    "5. Employer block.\n"
+    "6. 'Dear Hiring Team,' greeting.\n"
+    "7. 3-4 short paragraphs.\n"
+    "8. Signature with the candidate's name.\n\n"
+
+    "QUALITY CHECK:\n"
+    "- Ensure there is only ONE horizontal rule and it appears ONLY above the date.\n"
+    "- Ensure the date is NOT surrounded by rules.\n"
+    "- Ensure greeting is exactly 'Dear Hiring Team,'.\n"
+    "- Ensure ONLY one JSON object is returned.\n"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _fmt_date(d: date) -> str:
+    return d.strftime("%B %d, %Y")
+
+
+# ---------- public API ----------
 
 def build_prompt(
     job_info_json: str,
     resume_info: str,
     today: date | None = None,
-) -> Tuple[str, str]:
+) -> Prompt:
     """
     Build (system_msg, user_msg) to generate a tailored Markdown cover letter.
 
@@ -18,59 +80,7 @@ def build_prompt(
     if today is None:
         today = date.today()
 
-    date_str = today.strftime("%B %d, %Y")
-
-    # -------------------------
-    # SYSTEM MESSAGE
-    # -------------------------
-    system_msg = (
-        "You are an expert cover-letter writer that produces polished, truthful, "
-        "ATS-aware Markdown cover letters.\n\n"
-
-        "OUTPUT CONSTRAINTS (STRICT):\n"
-        "- Return ONLY one valid JSON object with a single top-level key 'data'.\n"
-        "- The value of 'data' must be a COMPLETE cover letter in Markdown.\n"
-        "- Use real newline characters. No code fences.\n"
-        "- Do NOT output placeholder text like '[Name]' or '[Date]'.\n\n"
-
-        "HEADER FORMAT RULES:\n"
-        "- Build a clean Markdown header using RESUME_JSON.basics.\n"
-        "- First line: '# **<candidate name>**'\n"
-        "- Then each contact field on its own line, with a blank line between each.\n\n"
-        "- After the final contact line AND its trailing blank line, output exactly:\n"
-        "      ---\n"
-        "- Then add ONE blank line.\n"
-        "- Then output the date line (CURRENT_DATE) on its own line.\n"
-        "- IMPORTANT: Never place a horizontal rule after the date. Only one rule exists, above the date.\n\n"
-
-        "EMPLOYER + GREETING:\n"
-        "- After the date line, output employer information from JOB_INFORMATION_JSON.\n"
-        "- Then ALWAYS use exactly:\n"
-        "      Dear Hiring Team,\n"
-        "- Never use recruiter names, manager names, or multiple greetings.\n\n"
-
-        "CONTENT RULES:\n"
-        "- Produce 3-4 concise paragraphs using active voice.\n"
-        "- No lists, tables, or images.\n"
-        "- Keep everything truthful to RESUME_JSON.\n"
-        "- Mention Roblox work only as independent, self-published.\n\n"
-
-        "STRUCTURE TO FOLLOW (EXACT ORDER):\n"
-        "1. Header block.\n"
-        "2. One horizontal rule ('---').\n"
-        "3. One blank line.\n"
-        "4. Date line using CURRENT_DATE.\n"
-        "5. Employer block.\n"
-        "6. 'Dear Hiring Team,' greeting.\n"
-        "7. 3-4 short paragraphs.\n"
-        "8. Signature with the candidate's name.\n\n"
-
-        "QUALITY CHECK:\n"
-        "- Ensure there is only ONE horizontal rule and it appears ONLY above the date.\n"
-        "- Ensure the date is NOT surrounded by rules.\n"
-        "- Ensure greeting is exactly 'Dear Hiring Team,'.\n"
-        "- Ensure ONLY one JSON object is returned.\n"
-    )
+    date_str = _fmt_date(today)
 
     # -------------------------
     # USER MESSAGE
@@ -97,4 +107,4 @@ def build_prompt(
         "- Return ONLY one JSON object with key 'data'.\n"
     )
 
-    return system_msg, user_msg
+    return Prompt(DEFAULT_SYSTEM, user_msg)
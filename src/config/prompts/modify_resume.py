@@ -2,29 +2,30 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
-from typing import Tuple, Dict, Any
+import functools
+import sys
+from typing import Final, Iterable, List, Tuple, Dict, Any
 
+from .._json import TEMPLATES_DIR, dumps_compact, load_path
+from ._types import Prompt
 
-# ---------- paths & loaders ----------
 
-def _tpl_dir() -> Path:
-    return Path(__file__).resolve().parents[1] / "templates"
+# ---------- paths & loaders ----------
 
+_MODIFY_RESUME_TPL = TEMPLATES_DIR / "modify_resume.json"
 
-def _compact(path: Path) -> str:
-    obj = json.loads(path.read_text(encoding="utf-8"))
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+_ALLOWED_SECTIONS: Final[frozenset[str]] = frozenset(("experience", "projects"))
+_EMPTY_TUPLE: Final[tuple] = ()
 
 
+@functools.lru_cache(maxsize=1)
 def _load_output_template_json() -> str:
-    return _compact(_tpl_dir() / "modify_resume.json")
+    return dumps_compact(load_path(_MODIFY_RESUME_TPL))
 
 
 # ---------- SYSTEM PROMPT ----------
 
-DEFAULT_SYSTEM = (
+DEFAULT_SYSTEM: Final[str] = sys.intern(
     "You tailor a single resume entry to a job. You are given structured job "
     "information, one base resume entry, and a JSON schema template. You rewrite "
     "only that entry so it aligns with the job while staying truthful.\n\n"
@@ -84,32 +85,25 @@ DEFAULT_SYSTEM = (
 )
 
 
-# ---------- public API ----------
-
-def build_prompt(
-    job_info_json: str,
+def _build_user(
+    job_info: str,
     section: str,
     base_entry: Dict[str, Any],
-) -> Tuple[str, str]:
-
-    if section not in {"experience", "projects"}:
+) -> str:
+    """
+    Build the user message; job_info must already be stripped.
+    """
+    if section not in _ALLOWED_SECTIONS:
         raise ValueError(f"section must be 'experience' or 'projects', got {section!r}")
 
-    base_entry_copy = dict(base_entry)
-    base_entry_copy["section"] = section
-
-    base_entry_str = json.dumps(
-        base_entry_copy,
-        ensure_ascii=False,
-        separators=(",", ":"),
-    )
+    base_entry_str = dumps_compact({**base_entry, "section": section})
 
     output_template_str = _load_output_template_json()
-    base_bullet_count = len(base_entry.get("bullets", []))
+    base_bullet_count = len(base_entry.get("bullets", _EMPTY_TUPLE))
 
-    user = (
+    return (
         "JOB_INFORMATION_JSON:\n"
-        f"{job_info_json.strip()}\n\n"
+        f"{job_info}\n\n"
         "SECTION_FOR_ENTRY:\n"
         f"{section}\n\n"
         "BASE_ENTRY_BULLET_COUNT:\n"
@@ -125,4 +119,30 @@ def build_prompt(
         "- Return ONE JSON object only."
     )
 
-    return DEFAULT_SYSTEM, user
\ No newline at end of file
+
+# ---------- public API ----------
+
+def build_prompt(
+    job_info_json: str,
+    section: str,
+    base_entry: Dict[str, Any],
+) -> Prompt:
+
+    return Prompt(DEFAULT_SYSTEM, _build_user(job_info_json.strip(), section, base_entry))
+
+
+def build_prompts_batch(
+    job_info_json: str,
+    entries: Iterable[Tuple[str, Dict[str, Any]]],
+) -> List[Prompt]:
+    """
+    Build a Prompt for every (section, base_entry) pair against
+    one job, e.g. to write a batch-API request file in a single pass.
+
+    The job JSON is stripped once and every prompt shares DEFAULT_SYSTEM.
+    """
+    job_info = job_info_json.strip()
+    return [
+        Prompt(DEFAULT_SYSTEM, _build_user(job_info, section, base_entry))
+        for section, base_entry in entries
+    ]
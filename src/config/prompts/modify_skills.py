@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
-import json
-from typing import Dict, Any, Tuple
+import functools
+import sys
+from typing import Dict, Any, Final, Sequence, Tuple
 
+from .._json import TEMPLATES_DIR, dumps_compact, load_path
+from ._types import Prompt
 
-def _compact(obj: Any) -> str:
-    """
-    Compact an object into a single-line JSON string for embedding in prompts.
-    """
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+_BANNED_CATEGORIES_TPL = TEMPLATES_DIR / "banned_categories.json"
 
 
 # ---------------- SYSTEM PROMPT ----------------
 
-DEFAULT_SYSTEM = """
+_SYSTEM_TEMPLATE = """
 You update the SKILLS section of a software engineer's resume.
 
 You must ONLY modify two lists:
@@ -40,20 +40,7 @@ ABSOLUTE HARD RULES
 
 2) **NO GENERIC CATEGORIES**
    These must NEVER appear:
-     - vector databases
-     - graph databases
-     - cloud platforms
-     - data pipelines
-     - search indexes
-     - ranking pipeline
-     - embeddings and retrieval
-     - AI infrastructure
-     - merchant integration
-     - commerce layer
-     - workflow orchestration
-     - CRMs
-     - ATS platforms
-     - analytics providers
+{banned_categories}
      - ANY multi-word phrase of any type
 
 3) **PROGRAMMING LANGUAGES**
@@ -102,14 +89,40 @@ Rules for output:
 """
 
 
+def _load_banned_categories() -> Tuple[str, ...]:
+    return tuple(load_path(_BANNED_CATEGORIES_TPL))
+
+
+@functools.lru_cache(maxsize=8)
+def _render_system(banned: Tuple[str, ...]) -> str:
+    """
+    Fill the banned generic categories into the system prompt template.
+    """
+    items = "".join(f"     - {category}\n" for category in banned)
+    return sys.intern(_SYSTEM_TEMPLATE.replace("{banned_categories}\n", items))
+
+
+BANNED_CATEGORIES: Final[Tuple[str, ...]] = _load_banned_categories()
+
+DEFAULT_SYSTEM: Final[str] = _render_system(BANNED_CATEGORIES)
 
 
 # ---------------- PROMPT BUILDER ----------------
 
+def precompile_base_skills(base_skills: Dict[str, Any]) -> str:
+    """
+    Serialize base skills once so a batch of per-job prompts can reuse the
+    string via build_modify_skills_prompt(..., base_skills_str=...).
+    """
+    return dumps_compact(base_skills)
+
+
 def build_modify_skills_prompt(
     base_skills: Dict[str, Any],
     job_extract: Dict[str, Any],
-) -> Tuple[str, str]:
+    base_skills_str: str | None = None,
+    banned: Sequence[str] | None = None,
+) -> Prompt:
     """
     Build the (system, user) messages for updating the Programming Languages /
     Technologies section using a structured job extract.
@@ -143,14 +156,24 @@ def build_modify_skills_prompt(
           "keywords_exact": []
         }
 
+    base_skills_str:
+        Optional output of precompile_base_skills(base_skills). When given,
+        base_skills is not re-serialized.
+
+    banned:
+        Optional replacement for BANNED_CATEGORIES, e.g. a shorter list to
+        save input tokens on cheaper models. Defaults to
+        templates/banned_categories.json.
+
     Returns
     -------
-    (system, user): Tuple[str, str]
-        system: DEFAULT_SYSTEM instructions.
+    Prompt (unpacks as (system, user))
+        system: DEFAULT_SYSTEM instructions (rendered with `banned` if given).
         user:   Concrete task with embedded base skills + job extract.
     """
-    base_skills_str = _compact(base_skills)
-    job_extract_str = _compact(job_extract)
+    if base_skills_str is None:
+        base_skills_str = dumps_compact(base_skills)
+    job_extract_str = dumps_compact(job_extract)
 
     user = (
       "You are updating ONLY the Programming Languages and Technologies section of the "
@@ -172,4 +195,6 @@ def build_modify_skills_prompt(
       "- Output EXACTLY one JSON object in the required schema."
   )
 
-    return DEFAULT_SYSTEM, user
+    system = DEFAULT_SYSTEM if banned is None else _render_system(tuple(banned))
+
+    return Prompt(system, user)
@@ -1,12 +1,14 @@
 from __future__ import annotations
-import json
+import functools
 import re
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Optional
+
+from .._json import dumps_pretty, loads
 
 
 # ---------- helpers ----------
 
-MONTH_MAP = {
+MONTH_MAP: Dict[str, str] = {
     "jan": "01",
     "january": "01",
     "feb": "02",
@@ -33,6 +35,19 @@ MONTH_MAP = {
     "december": "12",
 }
 
+# MONTH_MAP plus Title/UPPER variants, so the common spellings ("Jun", "JUN")
+# hit directly without a .lower() copy.
+_MONTH_LOOKUP: Dict[str, str] = {
+    variant: num
+    for key, num in MONTH_MAP.items()
+    for variant in (key, key.title(), key.upper())
+}
+
+
+# The string parsers below are pure and see the same inputs repeatedly
+# (shared date ranges, profile URLs), so each public helper guards against
+# non-strings and delegates to an lru_cache'd implementation.
+
 
 def _parse_city_region(location: str) -> Tuple[str, str]:
     """
@@ -41,6 +56,11 @@ def _parse_city_region(location: str) -> Tuple[str, str]:
     """
     if not isinstance(location, str):
         return "", ""
+    return _parse_city_region_cached(location)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_city_region_cached(location: str) -> Tuple[str, str]:
     parts = [p.strip() for p in location.split(",") if p.strip()]
     if not parts:
         return "", ""
@@ -58,37 +78,55 @@ def _parse_link_profile(url: str) -> Optional[Dict[str, str]]:
       'https://github.com/PCosby/' ->
         {"network": "GitHub", "username": "PCosby", "url": "..."}
     """
-    if not isinstance(url, str) or not url.strip():
+    if not isinstance(url, str):
+        return None
+    parsed = _parse_link_profile_cached(url)
+    if parsed is None:
         return None
+
+    network, username, url = parsed
+    return {
+        "network": network,
+        "username": username,
+        "url": url,
+    }
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_link_profile_cached(url: str) -> Optional[Tuple[str, str, str]]:
+    # Returns a tuple so cached results can't be mutated through the dict.
     url = url.strip()
+    if not url:
+        return None
 
-    lowered = url.lower()
-    if "linkedin.com" in lowered:
+    # Network detection only needs the host, not a lowercased copy of the URL
+    scheme_end = url.find("://")
+    rest_start = scheme_end + 3 if scheme_end != -1 else 0
+    slash = url.find("/", rest_start)
+    host = url[rest_start:slash if slash != -1 else len(url)].lower()
+    if "linkedin.com" in host:
         network = "LinkedIn"
-    elif "github.com" in lowered:
+    elif "github.com" in host:
         network = "GitHub"
     else:
         # Other networks are fine, keep generic
         network = "Profile"
 
     # Extract username as last non-empty segment
-    username = ""
-    try:
-        path = url.split("://", 1)[-1]
-        segments = [s for s in path.split("/") if s]
-        if segments:
-            username = segments[-1]
-    except Exception:
-        username = ""
+    end = len(url.rstrip("/"))
+    last_slash = url.rfind("/", rest_start, end)
+    username = url[(last_slash + 1 if last_slash != -1 else rest_start):end]
 
-    return {
-        "network": network,
-        "username": username,
-        "url": url,
-    }
+    return network, username, url
 
 
-_DATE_SPLIT_RE = re.compile(r"\s*[--—]\s*")  # split on -, - or —
+# Fallbacks after the " - " fast path, checked in order; spaced forms first
+_DATE_SEPARATORS: Tuple[str, ...] = (" \u2013 ", " \u2014 ", "-", "\u2013", "\u2014")
+_YEAR_RE = re.compile(r"\d{4}")
+_STRIP_PUNCT = str.maketrans("", "", ".,;:()[]{}'\"!?-")
+_NONWORD_RE = re.compile(r"[^\w]")
+_DEGREE_IN_RE = re.compile(r"\s+in\s+", re.IGNORECASE)
+_PRESENT_RE = re.compile(r"present", re.IGNORECASE)
 
 
 def _parse_month_year(text: str) -> Tuple[str, str]:
@@ -99,6 +137,11 @@ def _parse_month_year(text: str) -> Tuple[str, str]:
     """
     if not isinstance(text, str):
         return "", ""
+    return _parse_month_year_cached(text)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_month_year_cached(text: str) -> Tuple[str, str]:
     text = text.strip()
     if not text:
         return "", ""
@@ -107,13 +150,18 @@ def _parse_month_year(text: str) -> Tuple[str, str]:
     tokens = text.replace(",", " ").split()
     if len(tokens) < 2:
         return "", ""
-    month_raw = re.sub(r"[^\w]", "", tokens[0]).lower()
-    year_match = re.search(r"\d{4}", text)
+    month_raw = tokens[0].translate(_STRIP_PUNCT)
+    year_match = _YEAR_RE.search(text)
     if not year_match:
         return "", ""
 
     year = year_match.group(0)
-    month = MONTH_MAP.get(month_raw)
+    month = _MONTH_LOOKUP.get(month_raw) or MONTH_MAP.get(month_raw.lower(), "")
+    if not month:
+        # translate() only strips common ASCII punctuation; catch the rest
+        # (typographic quotes, '*', ...) the way the old regex did.
+        month_raw = _NONWORD_RE.sub("", tokens[0])
+        month = _MONTH_LOOKUP.get(month_raw) or MONTH_MAP.get(month_raw.lower(), "")
     if not month:
         return "", ""
     return year, month
@@ -132,22 +180,33 @@ def _parse_date_range(dates: str) -> Tuple[str, str]:
     """
     if not isinstance(dates, str):
         return "", ""
+    return _parse_date_range_cached(dates)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_date_range_cached(dates: str) -> Tuple[str, str]:
     dates = dates.strip()
     if not dates:
         return "", ""
 
-    parts = _DATE_SPLIT_RE.split(dates)
-    if not parts:
-        return "", ""
-
-    start_raw = parts[0].strip()
-    end_raw = parts[1].strip() if len(parts) > 1 else ""
+    head, sep, tail = dates.partition(" - ")
+    if sep:
+        start_raw, end_raw = head.strip(), tail.strip()
+    else:
+        for sep in _DATE_SEPARATORS:
+            i = dates.find(sep)
+            if i != -1:
+                start_raw = dates[:i].strip()
+                end_raw = dates[i + len(sep):].strip()
+                break
+        else:
+            start_raw, end_raw = dates, ""
 
     start_y, start_m = _parse_month_year(start_raw)
     start_iso = f"{start_y}-{start_m}" if start_y and start_m else ""
 
     end_iso = ""
-    if end_raw and not re.search(r"present", end_raw, re.IGNORECASE):
+    if end_raw and not _PRESENT_RE.search(end_raw):
         end_y, end_m = _parse_month_year(end_raw)
         if end_y and end_m:
             end_iso = f"{end_y}-{end_m}"
@@ -155,6 +214,30 @@ def _parse_date_range(dates: str) -> Tuple[str, str]:
     return start_iso, end_iso
 
 
+def _str_field(d: Dict[str, Any], key: str) -> str:
+    """
+    Same as str(d.get(key) or "").strip(), without the str() call for values
+    that are already strings.
+    """
+    value = d.get(key)
+    if not value:
+        return ""
+    if type(value) is str:
+        return value.strip()
+    return str(value).strip()
+
+
+def _keyword_list(values: Iterable[Any]) -> List[str]:
+    """
+    Stripped, non-empty string form of each value; str() is only called on
+    values that aren't strings already.
+    """
+    return [
+        kw for v in values
+        if (kw := (v if type(v) is str else str(v)).strip())
+    ]
+
+
 def _bullet_texts(entry: Dict[str, Any]) -> List[str]:
     bullets = entry.get("bullets") or []
     out: List[str] = []
@@ -169,6 +252,13 @@ def _bullet_texts(entry: Dict[str, Any]) -> List[str]:
     return out
 
 
+def _build_dict(*pairs: Tuple[str, Any]) -> Dict[str, Any]:
+    """
+    Build a dict from (key, value) pairs in order, dropping falsy values.
+    """
+    return {k: v for k, v in pairs if v}
+
+
 # ---------- converters to JSON Resume ----------
 
 
@@ -181,13 +271,13 @@ def _convert_basics(basics: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(basics, dict):
         basics = {}
 
-    name = str(basics.get("name") or "").strip()
-    email = str(basics.get("email") or "").strip()
-    phone = str(basics.get("phone") or "").strip()
-    location_str = str(basics.get("location") or "").strip()
-    website = str(basics.get("website") or "").strip()
-    linkedin = str(basics.get("linkedin") or "").strip()
-    github = str(basics.get("github") or "").strip()
+    name = _str_field(basics, "name")
+    email = _str_field(basics, "email")
+    phone = _str_field(basics, "phone")
+    location_str = _str_field(basics, "location")
+    website = _str_field(basics, "website")
+    linkedin = _str_field(basics, "linkedin")
+    github = _str_field(basics, "github")
 
     city, region = _parse_city_region(location_str)
 
@@ -197,29 +287,18 @@ def _convert_basics(basics: Dict[str, Any]) -> Dict[str, Any]:
         if p:
             profiles.append(p)
 
-    basics_out: Dict[str, Any] = {
+    return {
         "name": name,
+        **_build_dict(
+            ("email", email),
+            ("phone", phone),
+            ("url", website),  # JSON Resume uses 'url' for main site
+            # Location is nested object in JSON Resume
+            ("location", {"city": city, "region": region} if (city or region) else None),
+            ("profiles", profiles),
+        ),
     }
 
-    if email:
-        basics_out["email"] = email
-    if phone:
-        basics_out["phone"] = phone
-    if website:
-        basics_out["url"] = website  # JSON Resume uses 'url' for main site
-
-    # Location is nested object in JSON Resume
-    if city or region:
-        basics_out["location"] = {
-            "city": city,
-            "region": region,
-        }
-
-    if profiles:
-        basics_out["profiles"] = profiles
-
-    return basics_out
-
 
 def _split_degree_title(title: str) -> Tuple[str, str]:
     """
@@ -230,11 +309,16 @@ def _split_degree_title(title: str) -> Tuple[str, str]:
     """
     if not isinstance(title, str):
         return "", ""
+    return _split_degree_title_cached(title)
+
+
+@functools.lru_cache(maxsize=512)
+def _split_degree_title_cached(title: str) -> Tuple[str, str]:
     title = title.strip()
     if not title:
         return "", ""
 
-    parts = re.split(r"\s+in\s+", title, flags=re.IGNORECASE)
+    parts = _DEGREE_IN_RE.split(title)
     if len(parts) == 1:
         return title, ""
     study_type = parts[0].strip()
@@ -242,45 +326,66 @@ def _split_degree_title(title: str) -> Tuple[str, str]:
     return study_type, area
 
 
+def _convert_one_education(entry: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(entry, dict):
+        return None
+
+    name = _str_field(entry, "name")
+    title = _str_field(entry, "title")
+    dates = _str_field(entry, "dates")
+    location_str = _str_field(entry, "location")
+    gpa = _str_field(entry, "gpa")  # <-- NEW
+
+    study_type, area = _split_degree_title(title)
+    start_date, end_date = _parse_date_range(dates)
+
+    edu = _build_dict(
+        ("institution", name),
+        ("area", area),
+        ("studyType", study_type),
+        ("startDate", start_date),
+        ("endDate", end_date),
+        # Non-standard but useful: keep location if present
+        ("location", location_str),
+        # Use JSON Resume's "score" field for GPA so themes can render it
+        # ("score", gpa),
+        # ("gpa", gpa),
+    )
+
+    return edu or None
+
+
 def _convert_education(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    for entry in entries or []:
-        if not isinstance(entry, dict):
-            continue
+    return [edu for entry in entries or [] if (edu := _convert_one_education(entry))]
 
-        name = str(entry.get("name") or "").strip()
-        title = str(entry.get("title") or "").strip()
-        dates = str(entry.get("dates") or "").strip()
-        location_str = str(entry.get("location") or "").strip()
-        gpa = str(entry.get("gpa") or "").strip()  # <-- NEW
-
-        study_type, area = _split_degree_title(title)
-        start_date, end_date = _parse_date_range(dates)
-
-        edu: Dict[str, Any] = {}
-        if name:
-            edu["institution"] = name
-        if area:
-            edu["area"] = area
-        if study_type:
-            edu["studyType"] = study_type
-        if start_date:
-            edu["startDate"] = start_date
-        if end_date:
-            edu["endDate"] = end_date
 
-        # Non-standard but useful: keep location if present
-        if location_str:
-            edu["location"] = location_str
+def _convert_one_work(entry: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(entry, dict):
+        return None
 
-        # Use JSON Resume's "score" field for GPA so themes can render it
-        # if gpa:
-        # edu["score"] = gpa
-        # edu["gpa"] = gpa
+    company = _str_field(entry, "name")
+    position = _str_field(entry, "title")
+    location_str = _str_field(entry, "location")
+    dates = _str_field(entry, "dates")
+    tools = entry.get("tools") or []
 
-        if edu:
-            out.append(edu)
-    return out
+    start_date, end_date = _parse_date_range(dates)
+    highlights = _bullet_texts(entry)
+
+    # Optional: tuck tools into 'keywords' list (non-standard but many themes support)
+    tool_keywords = _keyword_list(tools)
+
+    work = _build_dict(
+        ("name", company),
+        ("position", position),
+        ("location", location_str),
+        ("startDate", start_date),
+        ("endDate", end_date),
+        ("highlights", highlights),
+        ("keywords", tool_keywords),
+    )
+
+    return work or None
 
 
 def _convert_experience(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -296,43 +401,31 @@ def _convert_experience(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         "bullets": [{ "id": "...", "text": "..." }, ...]
       }
     """
-    out: List[Dict[str, Any]] = []
-    for entry in entries or []:
-        if not isinstance(entry, dict):
-            continue
+    return [work for entry in entries or [] if (work := _convert_one_work(entry))]
 
-        company = str(entry.get("name") or "").strip()
-        position = str(entry.get("title") or "").strip()
-        location_str = str(entry.get("location") or "").strip()
-        dates = str(entry.get("dates") or "").strip()
-        tools = entry.get("tools") or []
-
-        start_date, end_date = _parse_date_range(dates)
-        highlights = _bullet_texts(entry)
-
-        work: Dict[str, Any] = {}
-        if company:
-            work["name"] = company
-        if position:
-            work["position"] = position
-        if location_str:
-            work["location"] = location_str
-        if start_date:
-            work["startDate"] = start_date
-        if end_date:
-            work["endDate"] = end_date
-        if highlights:
-            work["highlights"] = highlights
-
-        # Optional: tuck tools into 'keywords' list (non-standard but many themes support)
-        tool_keywords = [str(t).strip() for t in tools if str(t).strip()]
-        if tool_keywords:
-            work["keywords"] = tool_keywords
-
-        if work:
-            out.append(work)
 
-    return out
+def _convert_one_project(entry: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(entry, dict):
+        return None
+
+    name = _str_field(entry, "name")
+    dates = _str_field(entry, "dates")
+    tools = entry.get("tools") or []
+
+    start_date, end_date = _parse_date_range(dates)
+    highlights = _bullet_texts(entry)
+
+    tool_keywords = _keyword_list(tools)
+
+    proj = _build_dict(
+        ("name", name),
+        ("highlights", highlights),
+        ("startDate", start_date),
+        ("endDate", end_date),
+        ("keywords", tool_keywords),
+    )
+
+    return proj or None
 
 
 def _convert_projects(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -349,36 +442,27 @@ def _convert_projects(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         "bullets": [{ "id": "...", "text": "..." }, ...]
       }
     """
-    out: List[Dict[str, Any]] = []
-    for entry in entries or []:
-        if not isinstance(entry, dict):
-            continue
+    return [proj for entry in entries or [] if (proj := _convert_one_project(entry))]
 
-        name = str(entry.get("name") or "").strip()
-        dates = str(entry.get("dates") or "").strip()
-        tools = entry.get("tools") or []
 
-        start_date, end_date = _parse_date_range(dates)
-        highlights = _bullet_texts(entry)
-
-        proj: Dict[str, Any] = {}
-        if name:
-            proj["name"] = name
-        if highlights:
-            proj["highlights"] = highlights
-        if start_date:
-            proj["startDate"] = start_date
-        if end_date:
-            proj["endDate"] = end_date
-
-        tool_keywords = [str(t).strip() for t in tools if str(t).strip()]
-        if tool_keywords:
-            proj["keywords"] = tool_keywords
+def _convert_one_skill(key: Any, value: Any) -> Optional[Dict[str, Any]]:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        keywords = _keyword_list(value)
+    else:
+        # Single string or something else; split on commas as a fallback
+        keywords = [s.strip() for s in str(value).split(",") if s.strip()]
 
-        if proj:
-            out.append(proj)
+    if not keywords:
+        return None
 
-    return out
+    name = str(key).replace("_", " ").title()
+    return {
+        "name": name,
+        "level": "",
+        "keywords": keywords,
+    }
 
 
 def _convert_skills(skills: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -400,29 +484,11 @@ def _convert_skills(skills: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not isinstance(skills, dict):
         return []
 
-    out: List[Dict[str, Any]] = []
-    for key, value in skills.items():
-        if value is None:
-            continue
-        if isinstance(value, list):
-            keywords = [str(v).strip() for v in value if str(v).strip()]
-        else:
-            # Single string or something else; split on commas as a fallback
-            keywords = [s.strip() for s in str(value).split(",") if s.strip()]
-
-        if not keywords:
-            continue
-
-        name = str(key).replace("_", " ").title()
-        out.append(
-            {
-                "name": name,
-                "level": "",
-                "keywords": keywords,
-            }
-        )
-
-    return out
+    return [
+        skill
+        for key, value in skills.items()
+        if (skill := _convert_one_skill(key, value))
+    ]
 
 
 # ---------- PUBLIC API ----------
@@ -440,7 +506,7 @@ def to_json_resume(modified_resume_json_str: str) -> str:
     Returns:
         A pretty-printed JSON string following the JSON Resume schema.
     """
-    data = json.loads(modified_resume_json_str)
+    data = loads(modified_resume_json_str)
 
     basics_in = data.get("basics") or {}
     education_in = data.get("education") or []
@@ -466,4 +532,4 @@ def to_json_resume(modified_resume_json_str: str) -> str:
     # JSON Resume also supports: languages, interests, references, awards, etc.
     # You can wire those later if/when you add them to your base YAML/JSON.
 
-    return json.dumps(resume, ensure_ascii=False, indent=2)
+    return dumps_pretty(resume)
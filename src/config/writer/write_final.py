@@ -1,6 +1,6 @@
 from __future__ import annotations
+import os
 import subprocess
-import tempfile
 import shutil
 from pathlib import Path
 
@@ -14,15 +14,10 @@ def markdown_to_pdf(md_text: str, output_path: Path) -> Path:
     """
     output_path = Path(output_path).resolve()
 
-    with tempfile.NamedTemporaryFile(
-        "w", suffix=".md", delete=False, encoding="utf-8"
-    ) as md_file:
-        md_file.write(md_text)
-        md_path = Path(md_file.name)
-
+    # Feed the Markdown on stdin ("-") rather than through a temp file.
     cmd = [
         "pandoc",
-        str(md_path),
+        "-",
         "-o",
         str(output_path),
         "--from",
@@ -32,7 +27,7 @@ def markdown_to_pdf(md_text: str, output_path: Path) -> Path:
         "--quiet",
     ]
 
-    subprocess.run(cmd, check=True)
+    subprocess.run(cmd, input=md_text.encode("utf-8"), check=True)
     return output_path
 
 
@@ -95,6 +90,11 @@ def json_resume_to_pdf(
         )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(tmp_pdf_path, output_path)
+    try:
+        # Same filesystem (theme dir and out/ both live in the repo): a rename
+        # instead of copying the PDF bytes.
+        os.replace(tmp_pdf_path, output_path)
+    except OSError:
+        shutil.copy2(tmp_pdf_path, output_path)
 
     return output_path
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import copy
+import functools
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import webbrowser
-import json
 import yaml
 
-from dotenv import load_dotenv
-
-load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 import ollama_client
+from config._json import TEMPLATES_DIR, dumps_compact, dumps_pretty, loads
 import config.prompts.extract_job as extract_job
 import config.prompts.modify_resume as modify_resume
 import config.prompts.make_cover_letter as make_cover_letter
@@ -20,10 +25,12 @@ import config.writer.finalize_resume as finalize_resume
 import config.writer.write_final as write_final
 
 
+OUT_DIR = Path(__file__).resolve().parent.parent / "out"
+OUT_DIR.mkdir(parents=True, exist_ok=True)
+
+
 def write_to_file(content: str, file_name: str) -> None:
-    out_path = Path(f"../out/{file_name}").resolve()
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(content.rstrip() + "\n", encoding="utf-8")
+    (OUT_DIR / file_name).write_bytes(content.rstrip().encode("utf-8") + b"\n")
 
 
 def extract_job_info(selected_text: str) -> str:
@@ -34,14 +41,40 @@ def extract_job_info(selected_text: str) -> str:
     return response
 
 
-BASE_RESUME_PATH = (
-    Path(__file__).resolve().parent / "config" / "templates" / "base_resume.yml"
-)
+BASE_RESUME_PATH = TEMPLATES_DIR / "base_resume.yml"
 
 
-def _load_base_resume_yaml() -> dict:
+@functools.lru_cache(maxsize=1)
+def _parse_base_resume_yaml() -> dict:
+    """
+    Load base_resume.yml, using a pickled copy next to it (base_resume.pkl)
+    when that copy was built from the YAML's exact (mtime_ns, size).
+    A same-size edit that keeps the old mtime still reuses the stale copy;
+    delete base_resume.pkl to force a re-parse.
+    """
+    pkl_path = BASE_RESUME_PATH.with_suffix(".pkl")
+    stat = BASE_RESUME_PATH.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    try:
+        cached = pickle.loads(pkl_path.read_bytes())
+        if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == key:
+            return cached[1]
+    except Exception:
+        pass  # cache is best-effort: any bad pickle falls back to YAML
+
     text = BASE_RESUME_PATH.read_text(encoding="utf-8")
-    return yaml.safe_load(text)
+    obj = yaml.load(text, Loader=_YamlLoader)
+
+    try:
+        pkl_path.write_bytes(pickle.dumps((key, obj), protocol=5))
+    except OSError:
+        pass  # cache is best-effort
+    return obj
+
+
+def _load_base_resume_yaml() -> dict:
+    # Parse once per run; hand out copies so callers can't mutate the cache.
+    return copy.deepcopy(_parse_base_resume_yaml())
 
 
 def _modify_skills_info(job_info: str) -> str:
@@ -62,21 +95,29 @@ def _modify_skills_info(job_info: str) -> str:
 
     # Build system + user messages
     system_msg, user_msg = modify_skills.build_modify_skills_prompt(
-        base_skills=base_skills, job_extract=json.loads(job_info)
+        base_skills=base_skills, job_extract=loads(job_info)
     )
 
     # Call LLM
     response = ollama_client.run(system=system_msg, user=user_msg)
 
     # Should return {"skills": {...}}
-    skills_obj = json.loads(response)
+    skills_obj = loads(response)
 
     # Persist result
-    write_to_file(
-        json.dumps(skills_obj, ensure_ascii=False, indent=2), "modified_skills.json"
-    )
+    write_to_file(dumps_pretty(skills_obj), "modified_skills.json")
+
+    return dumps_compact(skills_obj)
 
-    return json.dumps(skills_obj, ensure_ascii=False)
+
+def _ollama_concurrency() -> int:
+    """
+    Max concurrent Ollama calls from OLLAMA_CONCURRENCY; 4 if unset or invalid.
+    """
+    try:
+        return max(1, int(os.getenv("OLLAMA_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
 
 
 def modify_resume_info(job_info: str) -> str:
@@ -85,7 +126,9 @@ def modify_resume_info(job_info: str) -> str:
 
     - Reads the canonical base resume from base_resume.yml.
     - For each entry in 'experience' and 'projects', calls the LLM once using
-      config.prompts.modify_resume.build_prompt(job_info, section, base_entry).
+      the prompts from config.prompts.modify_resume.build_prompts_batch().
+      Up to OLLAMA_CONCURRENCY (default 4) calls run at once, including the
+      skills update.
     - Aggregates the per-entry outputs into a single JSON object representing
       the modified resume.
 
@@ -104,31 +147,49 @@ def modify_resume_info(job_info: str) -> str:
     modified_resume["experience"] = []
     modified_resume["projects"] = []
 
-    for section in ("experience", "projects"):
-        entries = base_resume.get(section, []) or []
-        for entry in entries:
-            system_msg, user_msg = modify_resume.build_prompt(
-                job_info_json=job_info,
-                section=section,
-                base_entry=entry,
-            )
-            entry_response = ollama_client.run(system=system_msg, user=user_msg)
-
-            # Assume the model returns a single JSON object for this entry.
-            # No verification / repair here on purpose.
-            entry_obj = json.loads(entry_response)
-            entry_obj["tools"] = entry.get("tools", [])
-
-            modified_resume[section].append(entry_obj)
-            print(
-                f"[INFO] Tailored {section} entry {len(modified_resume[section])}/{len(entries)} added.",
-                flush=True,
+    section_entries = {
+        section: base_resume.get(section, []) or []
+        for section in ("experience", "projects")
+    }
+    pairs = [
+        (section, entry)
+        for section, entries in section_entries.items()
+        for entry in entries
+    ]
+
+    # Build every entry prompt up front so the job JSON is stripped once.
+    prompts = modify_resume.build_prompts_batch(job_info, pairs)
+
+    # Entry and skills calls are independent, so overlap them on the Ollama
+    # server. Results are consumed in submission order.
+    with ThreadPoolExecutor(max_workers=_ollama_concurrency()) as pool:
+        try:
+            skills_future = pool.submit(_modify_skills_info, job_info)
+            responses = pool.map(
+                lambda prompt: ollama_client.run(system=prompt.system, user=prompt.user),
+                prompts,
             )
 
-    modified_skills = json.loads(_modify_skills_info(job_info))
+            for (section, entry), entry_response in zip(pairs, responses):
+                # Assume the model returns a single JSON object for this entry.
+                # No verification / repair here on purpose.
+                entry_obj = loads(entry_response)
+                entry_obj["tools"] = entry.get("tools", [])
+
+                modified_resume[section].append(entry_obj)
+                print(
+                    f"[INFO] Tailored {section} entry {len(modified_resume[section])}/{len(section_entries[section])} added.",
+                    flush=True,
+                )
+
+            modified_skills = loads(skills_future.result())
+        except BaseException:
+            # Fail fast: drop queued LLM calls instead of waiting for them.
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
     modified_resume["skills"] = modified_skills.get("skills", {})
 
-    result_str = json.dumps(modified_resume, ensure_ascii=False, indent=2)
+    result_str = dumps_pretty(modified_resume)
 
     write_to_file(result_str, "modified_resume.json")
     return result_str
@@ -137,7 +198,7 @@ def modify_resume_info(job_info: str) -> str:
 def generate_cover_letter(job_info_json: str, resume_info: str) -> str:
     system_msg, user_msg = make_cover_letter.build_prompt(job_info_json, resume_info)
     response = ollama_client.run(system=system_msg, user=user_msg)
-    response_str = json.loads(response)["data"]
+    response_str = loads(response)["data"]
 
     write_to_file(response_str, "cover_letter.md")
     return response_str
@@ -153,14 +214,14 @@ def finalize_resume_info(modified_resume_info: str) -> str:
 def compile_resume_pdf(json_resume_text: str) -> Path:
     return write_final.json_resume_to_pdf(
         json_resume_text,
-        Path("../out/resume.pdf").resolve(),
+        OUT_DIR / "resume.pdf",
         theme=os.getenv("RESUME_THEME"),  # or None, or another installed theme name
     )
 
 
 def compile_cover_letter_pdf(letter_text: str) -> Path:
     return write_final.markdown_to_pdf(
-        letter_text, Path("../out/cover_letter.pdf").resolve()
+        letter_text, OUT_DIR / "cover_letter.pdf"
     )
 
 
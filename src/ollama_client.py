@@ -6,11 +6,11 @@ import os
 from pathlib import Path
 import sys
 from time import time
+from typing import Iterator
 import ollama  # official package
-from dotenv import load_dotenv
-
-load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
 
+# .env is loaded by run_resume_bot.py before this module is imported
+# (and by the __main__ block below for standalone CLI use).
 DEFAULT_MODEL = os.getenv("OLLAMA_MODEL")
 TEMP = float(os.getenv("OLLAMA_TEMPERATURE", "0.1"))
 DEFAULT_SYSTEM = (
@@ -21,21 +21,21 @@ DEFAULT_SYSTEM = (
 CONTEXT_SIZE = 40960
 
 
-def run(
+def run_stream(
     *,
     system: str = DEFAULT_SYSTEM,
     user: str,
     model: str = DEFAULT_MODEL,
     temp: float = TEMP,
-) -> str:
-    """Send system + user to an Ollama model and return the response text."""
+) -> Iterator[str]:
+    """Send system + user to an Ollama model and yield the response text as it is generated."""
 
     if len(system) + len(user) >= CONTEXT_SIZE * 0.9:
         print(
             "WARNING: Prompt length exceeds model context size. Truncation may occur."
         )
 
-    resp = ollama.chat(
+    stream = ollama.chat(
         model=model,
         messages=[
             {"role": "system", "content": system},
@@ -46,9 +46,21 @@ def run(
             "temperature": temp,  # lower = more deterministic
         },
         think=False,
-        stream=False,
+        stream=True,
     )
-    return resp["message"]["content"]
+    for chunk in stream:
+        yield chunk["message"]["content"]
+
+
+def run(
+    *,
+    system: str = DEFAULT_SYSTEM,
+    user: str,
+    model: str = DEFAULT_MODEL,
+    temp: float = TEMP,
+) -> str:
+    """Send system + user to an Ollama model and return the response text."""
+    return "".join(run_stream(system=system, user=user, model=model, temp=temp))
 
 
 if __name__ == "__main__":
@@ -56,11 +68,23 @@ if __name__ == "__main__":
         sys.stderr.write('Usage: python src/ollama_simple_cli.py "<user prompt>"\n')
         sys.exit(1)
 
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
+
     prompt = sys.argv[1]
     try:
-        out = run(user=prompt)  # uses default system + model
-        sys.stdout.write(out)
-        if not out.endswith("\n"):
+        last = ""
+        # uses default system; model/temp re-read now that .env is loaded
+        for piece in run_stream(
+            user=prompt,
+            model=os.getenv("OLLAMA_MODEL"),
+            temp=float(os.getenv("OLLAMA_TEMPERATURE", "0.1")),
+        ):
+            sys.stdout.write(piece)
+            sys.stdout.flush()
+            last = piece or last
+        if not last.endswith("\n"):
             sys.stdout.write("\n")
     except Exception as e:
         sys.stderr.write(f"Error: {e}\n")
@@ -1,10 +1,12 @@
 import os
 from pathlib import Path
-import helper
 from dotenv import load_dotenv
 
+# Load .env once, before helper/ollama_client read settings at import time.
 load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
 
+import helper
+
 selection_file = Path(__file__).parent.parent / "out" / "selected.txt"
 MAKE_COVER_LETTER = os.getenv("MAKE_COVER_LETTER", "False").lower() in [
     "t",